@@ -42,11 +42,14 @@ class QuickBarsRuntime:
 class _Presence:
     """Zeroconf: track the app instance and keep host/port fresh."""
 
+    __slots__ = ("_aiozc", "_browser", "_wanted_id", "entry", "hass")
+
     def __init__(self, hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
         self._browser: AsyncServiceBrowser | None = None
         self._aiozc: HaAsyncZeroconf | None = None
+        self._wanted_id = _entry_app_id(entry).strip().lower()
 
     async def start(self) -> None:
         self._aiozc = await ha_zc.async_get_async_instance(self.hass)
@@ -69,27 +72,14 @@ class _Presence:
             _, service_type, name, state_change = args
 
         if (
-            isinstance(service_type, str)
+            service_type == SERVICE_TYPE
             and isinstance(name, str)
             and isinstance(state_change, ServiceStateChange)
+            and state_change is not ServiceStateChange.Removed
         ):
-            self.hass.async_create_task(
-                self._handle_change(service_type, name, state_change)
-            )
-
-    async def _handle_change(
-        self, service_type: str, name: str, state_change: ServiceStateChange
-    ) -> None:
-        if service_type != SERVICE_TYPE:
-            return
-
-        wanted_id = (
-            (self.entry.data.get(CONF_ID) or self.entry.unique_id or "").strip().lower()
-        )
-
-        if state_change is ServiceStateChange.Removed:
-            return
+            self.hass.async_create_task(self._handle_change(service_type, name))
 
+    async def _handle_change(self, service_type: str, name: str) -> None:
         if self._aiozc is None:
             return
 
@@ -97,14 +87,10 @@ class _Presence:
         if not info:
             return
 
-        props: dict[str, str] = {}
-        for k, v in (info.properties or {}).items():
-            key = k.decode() if isinstance(k, (bytes, bytearray)) else str(k)
-            val = v.decode() if isinstance(v, (bytes, bytearray)) else str(v)
-            props[key] = val
-
-        found_id = (props.get("id") or "").strip().lower()
-        if not found_id or found_id != wanted_id:
+        # Only the app id is needed, so skip decoding the rest of the TXT record
+        raw_id = (info.properties or {}).get(b"id")
+        found_id = raw_id.decode().strip().lower() if raw_id else ""
+        if not found_id or found_id != self._wanted_id:
             return
 
         host = (info.parsed_addresses() or [self.entry.data.get(CONF_HOST) or ""])[0]
@@ -126,6 +112,10 @@ class _Presence:
                 self.hass.async_create_task(rt.coordinator.async_request_refresh())
 
 
+def _entry_app_id(entry: config_entries.ConfigEntry) -> str:
+    """Return the QuickBars app id an entry talks to."""
+    return entry.data.get(CONF_ID) or entry.unique_id or entry.entry_id
+
 def _entry_for_device(
     hass: HomeAssistant, device_id: str | None
 ) -> config_entries.ConfigEntry | None:
@@ -154,9 +144,7 @@ async def _svc_notify(hass: HomeAssistant, call: ServiceCall) -> None:
 
     payload = await build_notify_payload(hass, call.data)
     if entry2:
-        payload[CONF_ID] = (
-            entry2.data.get(CONF_ID) or entry2.unique_id or entry2.entry_id
-        )
+        payload[CONF_ID] = _entry_app_id(entry2)
 
     cid = call.data.get("cid") or secrets.token_urlsafe(8)
     payload["cid"] = cid
@@ -201,16 +189,18 @@ async def async_setup_entry(
     await coordinator.async_config_entry_first_refresh()
 
     # Bridge TV button clicks -> HA event (per-entry)
+    exp_id = _entry_app_id(entry)
+    device_id = device.id
+
     def _on_action(evt):
         data = evt.data or {}
-        exp_id = entry.data.get(CONF_ID) or entry.unique_id or entry.entry_id
         incoming_id = data.get(CONF_ID)
         if incoming_id and incoming_id != exp_id:
             return
         hass.bus.async_fire(
             f"{DOMAIN}.notification_action",
             {
-                "device_id": entry.runtime_data.device_id,
+                "device_id": device_id,
                 "entry_id": entry.entry_id,
                 "cid": data.get("cid"),
                 "action_id": data.get("action_id"),
@@ -11,8 +11,7 @@ from quickbars_bridge import QuickBarsClient
 from quickbars_bridge.hass_flow import decode_zeroconf, default_ha_url, schema_token
 import voluptuous as vol
 
-from homeassistant import config_entries
-from homeassistant.config_entries import ConfigFlowResult
+from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_ID, CONF_PORT
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.network import get_url
@@ -24,18 +23,17 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-def schema_host_port(default_host: str | None, default_port: int | None) -> vol.Schema:
-    """Return schema for host/port input form."""
-    return vol.Schema(
-        {
-            vol.Required(CONF_HOST, default=default_host): str,
-            vol.Required(
-                CONF_PORT, default=default_port if default_port is not None else 9123
-            ): int,
-        }
-    )
-
-class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+# Built once; retries only patch in the last entered values as suggestions
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_PORT, default=9123): int,
+    }
+)
+_PAIR_SCHEMA = vol.Schema({vol.Required("code"): str})
+_EMPTY_SCHEMA = vol.Schema({})
+
+class QuickBarsConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle the QuickBars config flow."""
 
     def __init__(self) -> None:
@@ -45,10 +43,28 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._pair_sid: str | None = None
         self._paired_name: str | None = None
         self._props: dict[str, Any] | None = None
-        # Options flow will set these, but keeping for type safety:
-        self._snapshot: dict[str, Any] | None = None
-        self._entity_id: str | None = None
-        self._qb_index: int | None = None
+        self._ha_url: str | None = None
+
+    def _get_ha_url(self) -> str:
+        """Return the HA URL sent to the TV, resolved once per flow."""
+        if self._ha_url is None:
+            self._ha_url = ""
+            with suppress(HomeAssistantError):
+                # best effort; raises HomeAssistantError if not configured
+                self._ha_url = get_url(self.hass)
+        return self._ha_url
+
+    def _show_user_form(self, error: str | None = None) -> ConfigFlowResult:
+        """Show the host/port form, prefilled with the last values on error."""
+        if error is None:
+            return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(
+                _USER_SCHEMA, {CONF_HOST: self._host, CONF_PORT: self._port}
+            ),
+            errors={"base": error},
+        )
 
     # Manual Path
     async def async_step_user(
@@ -56,9 +72,7 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Start the flow: collect host/port and request a pairing code."""
         if user_input is None:
-            return self.async_show_form(
-                step_id="user", data_schema=schema_host_port(None, 9123)
-            )
+            return self._show_user_form()
 
         self._host = user_input[CONF_HOST]
         self._port = user_input[CONF_PORT]
@@ -66,15 +80,15 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             client = QuickBarsClient(self._host, self._port)
             resp = await client.get_pair_code()
-        except (TimeoutError, OSError, ClientError):
-            _LOGGER.exception(
-                "Step_user: get_pair_code failed for %s:%s", self._host, self._port
-            )
-            return self.async_show_form(
-                step_id="user",
-                data_schema=schema_host_port(self._host, self._port),
-                errors={"base": "tv_unreachable"},
+        except (TimeoutError, OSError, ClientError) as err:
+            # An offline TV is the expected failure here; skip the traceback
+            _LOGGER.debug(
+                "Step_user: get_pair_code failed for %s:%s: %s",
+                self._host,
+                self._port,
+                err,
             )
+            return self._show_user_form("tv_unreachable")
         else:
             self._pair_sid = resp.get("sid")
 
@@ -84,9 +98,8 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Submit the code shown on the TV and create the entry (or continue to token)."""
-        schema = vol.Schema({vol.Required("code"): str})
         if user_input is None:
-            return self.async_show_form(step_id="pair", data_schema=schema)
+            return self.async_show_form(step_id="pair", data_schema=_PAIR_SCHEMA)
 
         code = user_input["code"].strip()
         sid = self._pair_sid
@@ -94,19 +107,18 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         client = QuickBarsClient(self._host, self._port)
         ha_name = self.hass.config.location_name or "Home Assistant"
 
-        ha_url = None
-        with suppress(HomeAssistantError):
-            # best effort; raises HomeAssistantError if not configured
-            ha_url = get_url(self.hass)
-
         resp = await client.confirm_pair(
-            code, sid, ha_instance=self._host, ha_name=ha_name, ha_url=ha_url
+            code,
+            sid,
+            ha_instance=self._host,
+            ha_name=ha_name,
+            ha_url=self._get_ha_url(),
         )
         qb_id = resp.get("id")
         if not qb_id:
             return self.async_show_form(
                 step_id="pair",
-                data_schema=schema,
+                data_schema=_PAIR_SCHEMA,
                 errors={"base": "no_unique_id"},
             )
 
@@ -138,11 +150,11 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Collect HA URL + long-lived token and send them to the TV app."""
-        default_url = default_ha_url(self.hass)
-        schema = schema_token(default_url, None)
-
         if user_input is None:
-            return self.async_show_form(step_id="token", data_schema=schema)
+            return self.async_show_form(
+                step_id="token",
+                data_schema=schema_token(default_ha_url(self.hass), None),
+            )
 
         url = user_input["url"].strip()
         token = user_input["token"].strip()
@@ -150,26 +162,24 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             client = QuickBarsClient(self._host, self._port)
             res = await client.set_credentials(url, token)
-            if not res.get("ok"):
-                return self.async_show_form(
-                    step_id="token",
-                    data_schema=schema_token(url, token),
-                    errors={"base": "creds_invalid"},
-                )
         except (TimeoutError, OSError, ClientError):
-            return self.async_show_form(
-                step_id="token",
-                data_schema=schema_token(url, token),
-                errors={"base": "tv_unreachable"},
-            )
+            error = "tv_unreachable"
+        else:
+            if res.get("ok"):
+                return self.async_create_entry(
+                    title=self._paired_name or "QuickBars TV",
+                    data={
+                        CONF_HOST: self._host,
+                        CONF_PORT: self._port,
+                        CONF_ID: self.unique_id,
+                    },
+                )
+            error = "creds_invalid"
 
-        return self.async_create_entry(
-            title=self._paired_name or "QuickBars TV",
-            data={
-                CONF_HOST: self._host,
-                CONF_PORT: self._port,
-                CONF_ID: self.unique_id,
-            },
+        return self.async_show_form(
+            step_id="token",
+            data_schema=schema_token(url, token),
+            errors={"base": error},
         )
 
     # -------- Zeroconf path --------
@@ -179,7 +189,6 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle zeroconf discovery and show a confirmation step."""
         host, port, props, _hostname, _name = decode_zeroconf(discovery_info)
         unique = (props.get("id") or "").strip()
-        title = props.get("name") or "QuickBars TV App"
 
         if not host or not port:
             return self.async_abort(reason="unknown")
@@ -191,27 +200,14 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         self._host, self._port, self._props = host, port, props
-        self.context["title_placeholders"] = {"name": title}
-
-        return self.async_show_form(
-            step_id="zeroconf_confirm",
-            data_schema=vol.Schema({}),
-            description_placeholders={
-                "id": (props.get("id") or ""),
-                "host": host,
-                "port": str(port),
-                "api": (props.get("api") or ""),
-                "app_version": (props.get("app_version") or ""),
-                "name": title,
-            },
-        )
+        return await self.async_step_zeroconf_confirm()
 
     async def async_step_zeroconf_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """After the user confirms the discovered device, request a code and continue."""
         if user_input is None:
-            props = getattr(self, "_props", {}) or {}
+            props = self._props or {}
             qb_name = props.get("name") or "QuickBars TV App"
             host = self._host or ""
             port = self._port
@@ -219,7 +215,7 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_show_form(
                 step_id="zeroconf_confirm",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 description_placeholders={
                     "id": (props.get("id") or ""),
                     "host": host,
@@ -233,17 +229,14 @@ class QuickBarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             client = QuickBarsClient(self._host, self._port)
             resp = await client.get_pair_code()
-        except (TimeoutError, OSError, ClientError):
-            _LOGGER.exception(
-                "Step_zeroconf_confirm: get_pair_code failed for %s:%s",
+        except (TimeoutError, OSError, ClientError) as err:
+            _LOGGER.debug(
+                "Step_zeroconf_confirm: get_pair_code failed for %s:%s: %s",
                 self._host,
                 self._port,
+                err,
             )
-            return self.async_show_form(
-                step_id="user",
-                data_schema=schema_host_port(self._host, self._port),
-                errors={"base": "tv_unreachable"},
-            )
+            return self._show_user_form("tv_unreachable")
         else:
             self._pair_sid = resp.get("sid")
 
@@ -16,10 +16,10 @@ ATTR_AUTO_HIDE = "auto_hide"
 ATTR_SHOW_TITLE = "show_title"
 
 
-SIZE_CHOICES = ["small", "medium", "large"]
+SIZE_CHOICES = ("small", "medium", "large")
 
 
-ALLOWED_DOMAINS = [
+ALLOWED_DOMAINS = (
     "light",
     "switch",
     "button",
@@ -37,11 +37,11 @@ ALLOWED_DOMAINS = [
     "camera",
     "automation",
     "media_player",
-]
+)
 DOMAIN = "quickbars"
 
 EVENT_NAME = "quickbars.open"
 SERVICE_TYPE = "_quickbars._tcp.local."
 
 # camera positions
-POS_CHOICES = ["top_left", "top_right", "bottom_left", "bottom_right"]
+POS_CHOICES = ("top_left", "top_right", "bottom_left", "bottom_right")